@@ -12,7 +12,7 @@ Azure Cognitive Services expects exactly these parameters for 3D viseme output:
 Reference: https://docs.microsoft.com/azure/cognitive-services/speech-service/how-to-speech-synthesis-viseme
 """
 
-from typing import List, TypedDict, Literal, Final, Union
+from typing import Dict, FrozenSet, List, Tuple, TypedDict, Literal, Final, Union
 
 # Type definitions for better type safety
 AzureBlendshapeName = Literal[
@@ -40,6 +40,7 @@ AzureBlendshapeName = Literal[
 
 AzureRotationName = Literal["headRoll", "leftEyeRoll", "rightEyeRoll"]
 AzureParameterName = Union[AzureBlendshapeName, AzureRotationName]
+BlendshapeCategory = Literal["eye", "jaw", "mouth", "brow", "cheek", "nose"]
 
 # For practical typing, use int with range validation in functions
 BlendshapeIndex = int  # 0-54, validated at runtime
@@ -142,8 +143,19 @@ ROTATION_PARAMETERS: Final[List[AzureRotationName]] = [
     "rightEyeRoll",        # Right eye rotation (index 54)
 ]
 
+# Parameter counts, computed once at import (the lists never change at runtime)
+_FACIAL_COUNT: Final[int] = len(FACIAL_BLENDSHAPES)    # 52
+_ROTATION_COUNT: Final[int] = len(ROTATION_PARAMETERS)  # 3
+
+# Hashed lookups for membership and index queries (the lists above stay the ordered source of truth)
+_FACIAL_SET: Final[FrozenSet[str]] = frozenset(FACIAL_BLENDSHAPES)
+_ROTATION_SET: Final[FrozenSet[str]] = frozenset(ROTATION_PARAMETERS)
+_PARAMETER_INDEX: Final[Dict[str, int]] = {
+    name: index for index, name in enumerate([*FACIAL_BLENDSHAPES, *ROTATION_PARAMETERS])
+}
+
 # Total number of parameters Azure outputs
-TOTAL_PARAMETERS: Final[int] = len(FACIAL_BLENDSHAPES) + len(ROTATION_PARAMETERS)  # 55
+TOTAL_PARAMETERS: Final[int] = _FACIAL_COUNT + _ROTATION_COUNT  # 55
 
 # Structured data for programmatic access
 AZURE_BLENDSHAPES_DATA: Final[AzureBlendshapesData] = {
@@ -153,8 +165,8 @@ AZURE_BLENDSHAPES_DATA: Final[AzureBlendshapesData] = {
     "rotation_parameters": ROTATION_PARAMETERS,
     "total_parameters": TOTAL_PARAMETERS,
     "parameter_breakdown": {
-        "facial_blendshapes": len(FACIAL_BLENDSHAPES),
-        "rotation_parameters": len(ROTATION_PARAMETERS)
+        "facial_blendshapes": _FACIAL_COUNT,
+        "rotation_parameters": _ROTATION_COUNT
     },
     "categories": {
         "eye_blendshapes": 14,
@@ -188,10 +200,10 @@ def get_blendshape_by_index(index: BlendshapeIndex) -> AzureParameterName:
     if index < 0 or index >= TOTAL_PARAMETERS:
         raise IndexError(f"Index {index} out of range (0-{TOTAL_PARAMETERS-1})")
 
-    if index < len(FACIAL_BLENDSHAPES):
+    if index < _FACIAL_COUNT:
         return FACIAL_BLENDSHAPES[index]
     else:
-        return ROTATION_PARAMETERS[index - len(FACIAL_BLENDSHAPES)]
+        return ROTATION_PARAMETERS[index - _FACIAL_COUNT]
 
 def get_blendshape_index(name: AzureParameterName) -> BlendshapeIndex:
     """
@@ -212,12 +224,10 @@ def get_blendshape_index(name: AzureParameterName) -> BlendshapeIndex:
         >>> get_blendshape_index('headRoll')
         52
     """
-    if name in FACIAL_BLENDSHAPES:
-        return FACIAL_BLENDSHAPES.index(name)
-    elif name in ROTATION_PARAMETERS:
-        return len(FACIAL_BLENDSHAPES) + ROTATION_PARAMETERS.index(name)
-    else:
-        raise ValueError(f"Blendshape '{name}' not found in Azure parameters")
+    try:
+        return _PARAMETER_INDEX[name]
+    except KeyError:
+        raise ValueError(f"Blendshape '{name}' not found in Azure parameters") from None
 
 def is_rotation_parameter(name: AzureParameterName) -> bool:
     """
@@ -235,7 +245,7 @@ def is_rotation_parameter(name: AzureParameterName) -> bool:
         >>> is_rotation_parameter('eyeBlinkLeft')
         False
     """
-    return name in ROTATION_PARAMETERS
+    return name in _ROTATION_SET
 
 def is_facial_blendshape(name: AzureParameterName) -> bool:
     """
@@ -253,9 +263,20 @@ def is_facial_blendshape(name: AzureParameterName) -> bool:
         >>> is_facial_blendshape('headRoll')
         False
     """
-    return name in FACIAL_BLENDSHAPES
-
-def get_blendshape_category(name: AzureBlendshapeName) -> Literal["eye", "jaw", "mouth", "brow", "cheek", "nose"]:
+    return name in _FACIAL_SET
+
+# Name prefix -> category, checked in order (tongueOut is grouped with the mouth shapes)
+_CATEGORY_PREFIXES: Final[Tuple[Tuple[str, BlendshapeCategory], ...]] = (
+    ("eye", "eye"),
+    ("jaw", "jaw"),
+    ("mouth", "mouth"),
+    ("tongueOut", "mouth"),
+    ("brow", "brow"),
+    ("cheek", "cheek"),
+    ("nose", "nose"),
+)
+
+def get_blendshape_category(name: AzureBlendshapeName) -> BlendshapeCategory:
     """
     Get the category of an Azure blendshape.
 
@@ -274,17 +295,7 @@ def get_blendshape_category(name: AzureBlendshapeName) -> Literal["eye", "jaw",
         >>> get_blendshape_category('jawOpen')
         'jaw'
     """
-    if name.startswith('eye'):
-        return "eye"
-    elif name.startswith('jaw'):
-        return "jaw"
-    elif name.startswith('mouth') or name == 'tongueOut':
-        return "mouth"
-    elif name.startswith('brow'):
-        return "brow"
-    elif name.startswith('cheek'):
-        return "cheek"
-    elif name.startswith('nose'):
-        return "nose"
-    else:
-        raise ValueError(f"Unknown blendshape category for '{name}'")
+    for prefix, category in _CATEGORY_PREFIXES:
+        if name.startswith(prefix):
+            return category
+    raise ValueError(f"Unknown blendshape category for '{name}'")
@@ -14,10 +14,10 @@ Key mapping patterns:
 Total mappings: 110 (covers various MetaHuman naming conventions)
 """
 
-from typing import Dict, List, Set, TypedDict, Literal, Final, Union
+from typing import Dict, FrozenSet, List, Set, TypedDict, Literal, Final, Union
 
 # Import Azure types from the blendshapes module for consistency
-from .azure_blendshapes_complete import AzureBlendshapeName
+from .azure_blendshapes_complete import AzureBlendshapeName, BlendshapeCategory, get_blendshape_category
 
 # Type definitions for MetaHuman naming patterns
 MetaHumanMorphName = str  # MetaHuman morph target names (too many variations for Literal)
@@ -36,6 +36,16 @@ MappingCategory = Literal[
     "tongue_blendshapes"
 ]
 
+# Azure blendshape category -> mapping category
+_MAPPING_CATEGORIES: Final[Dict[BlendshapeCategory, MappingCategory]] = {
+    "eye": "eye_blendshapes",
+    "jaw": "jaw_blendshapes",
+    "mouth": "mouth_blendshapes",
+    "brow": "brow_blendshapes",
+    "cheek": "cheek_blendshapes",
+    "nose": "nose_blendshapes",
+}
+
 class MappingStats(TypedDict):
     """Type definition for mapping statistics structure."""
     total_mappings: int
@@ -221,6 +231,19 @@ MAPPING_STATS: Final[MappingStats] = {
     "tongue_blendshapes": 2,    # May be on teeth mesh
 }
 
+def _build_reverse_index() -> Dict[AzureBlendshapeName, List[MetaHumanMorphName]]:
+    """Group MetaHuman names by the Azure blendshape they map to, in mapping order."""
+    reverse_index: Dict[AzureBlendshapeName, List[MetaHumanMorphName]] = {}
+    for metahuman_name, azure_name in METAHUMAN_NAME_MAPPINGS.items():
+        reverse_index.setdefault(azure_name, []).append(metahuman_name)
+    return reverse_index
+
+# Reverse index: Azure name -> MetaHuman names mapping to it (built once at import)
+_METAHUMAN_NAMES_BY_AZURE: Final[Dict[AzureBlendshapeName, List[MetaHumanMorphName]]] = _build_reverse_index()
+
+# Distinct Azure targets across all mappings, frozen once (get_unique_azure_mappings hands out copies)
+_UNIQUE_AZURE_NAMES: Final[FrozenSet[AzureBlendshapeName]] = frozenset(_METAHUMAN_NAMES_BY_AZURE)
+
 def get_azure_name(metahuman_name: MetaHumanMorphName) -> AzureBlendshapeName:
     """
     Get Azure blendshape name from MetaHuman morph target name.
@@ -260,8 +283,7 @@ def get_metahuman_names(azure_name: AzureBlendshapeName) -> List[MetaHumanMorphN
         >>> get_metahuman_names('mouthFunnel')
         ['head_lod0_mesh__mouth_funnel_DL', 'mouth_funnel_DL']
     """
-    return [meta_name for meta_name, azure in METAHUMAN_NAME_MAPPINGS.items()
-            if azure == azure_name]
+    return list(_METAHUMAN_NAMES_BY_AZURE.get(azure_name, ()))
 
 def has_mesh_prefix(metahuman_name: MetaHumanMorphName) -> bool:
     """
@@ -316,7 +338,7 @@ def get_unique_azure_mappings() -> Set[AzureBlendshapeName]:
         >>> len(azure_names)  # Should be less than total mappings due to duplicates
         52
     """
-    return set(METAHUMAN_NAME_MAPPINGS.values())
+    return set(_UNIQUE_AZURE_NAMES)
 
 def is_compound_mapping(azure_name: AzureBlendshapeName) -> bool:
     """
@@ -334,7 +356,7 @@ def is_compound_mapping(azure_name: AzureBlendshapeName) -> bool:
         >>> is_compound_mapping('jawOpen')
         False  # Only prefixed and non-prefixed variants
     """
-    return len(get_metahuman_names(azure_name)) > 1
+    return len(_METAHUMAN_NAMES_BY_AZURE.get(azure_name, ())) > 1
 
 def analyze_mapping(metahuman_name: MetaHumanMorphName) -> MappingAnalysis:
     """
@@ -355,21 +377,8 @@ def analyze_mapping(metahuman_name: MetaHumanMorphName) -> MappingAnalysis:
     """
     azure_name = get_azure_name(metahuman_name)  # May raise KeyError
 
-    # Determine category based on Azure name
-    if azure_name.startswith('eye'):
-        category: MappingCategory = "eye_blendshapes"
-    elif azure_name.startswith('jaw'):
-        category = "jaw_blendshapes"
-    elif azure_name.startswith('mouth') or azure_name == 'tongueOut':
-        category = "mouth_blendshapes"
-    elif azure_name.startswith('brow'):
-        category = "brow_blendshapes"
-    elif azure_name.startswith('cheek'):
-        category = "cheek_blendshapes"
-    elif azure_name.startswith('nose'):
-        category = "nose_blendshapes"
-    else:  # tongueOut
-        category = "tongue_blendshapes"
+    # Determine category based on Azure name (shares the prefix table with get_blendshape_category)
+    category = _MAPPING_CATEGORIES[get_blendshape_category(azure_name)]
 
     return {
         "has_mesh_prefix": has_mesh_prefix(metahuman_name),
@@ -393,12 +402,9 @@ def get_mappings_by_category(category: MappingCategory) -> Dict[MetaHumanMorphNa
         >>> len(eye_mappings)
         28
     """
-    category_mappings: Dict[MetaHumanMorphName, AzureBlendshapeName] = {}
-    for meta_name, azure_name in METAHUMAN_NAME_MAPPINGS.items():
-        try:
-            analysis = analyze_mapping(meta_name)
-            if analysis["category"] == category:
-                category_mappings[meta_name] = azure_name
-        except KeyError:
-            continue
-    return category_mappings
+    # Every key comes from METAHUMAN_NAME_MAPPINGS, so analyze_mapping cannot raise KeyError here
+    return {
+        meta_name: azure_name
+        for meta_name, azure_name in METAHUMAN_NAME_MAPPINGS.items()
+        if analyze_mapping(meta_name)["category"] == category
+    }
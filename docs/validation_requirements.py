@@ -14,7 +14,9 @@ Validation ensures:
 Used by step1_validation for pre-processing verification.
 """
 
-from typing import List, Dict, Optional, TypedDict, Literal, Final, Union
+import re
+from collections import Counter
+from typing import List, Dict, FrozenSet, Optional, Pattern, Tuple, TypedDict, Literal, Final, Union
 from enum import Enum
 
 # Type definitions for validation structures
@@ -94,6 +96,11 @@ REQUIRED_BONES: Final[List[BoneName]] = [
     "RightEye",        # Capitalized variant
 ]
 
+# Required bone groups (one variant of each must be present), frozen once for membership checks
+_HEAD_BONES: Final[FrozenSet[str]] = frozenset({"head", "head_joint", "Head"})
+_LEFT_EYE_BONES: Final[FrozenSet[str]] = frozenset({"leftEye", "left_eye", "LeftEye"})
+_RIGHT_EYE_BONES: Final[FrozenSet[str]] = frozenset({"rightEye", "right_eye", "RightEye"})
+
 # Optional bones that may be present but not required
 OPTIONAL_BONES: Final[List[str]] = [
     "neck",            # Neck bone for additional head control
@@ -117,6 +124,9 @@ OPTIONAL_MESH_PREFIXES: Final[List[str]] = [
     "eyelashes_lod0_mesh__", # Eyelashes mesh prefix
 ]
 
+# All known mesh prefixes, required first, as a tuple for str.startswith
+_ALL_MESH_PREFIXES: Final[Tuple[str, ...]] = tuple(REQUIRED_MESH_PREFIXES + OPTIONAL_MESH_PREFIXES)
+
 # Validation patterns for morph target names
 VALIDATION_PATTERNS: Final[List[str]] = [
     r"^head_lod0_mesh__\w+",           # Head mesh morphs
@@ -126,6 +136,9 @@ VALIDATION_PATTERNS: Final[List[str]] = [
     r"^(eye|jaw|mouth|brow|cheek|nose)_\w+", # Facial feature categories
 ]
 
+# All validation patterns compiled once into a single alternation (matches if any pattern matches)
+_VALIDATION_REGEX: Final[Pattern[str]] = re.compile("|".join(f"(?:{pattern})" for pattern in VALIDATION_PATTERNS))
+
 # File format requirements
 FILE_FORMAT_REQUIREMENTS: Final[Dict[str, Union[str, bool, int]]] = {
     "extension": ".fbx",
@@ -210,37 +223,34 @@ def validate_bone_presence(bones_found: List[str]) -> List[ValidationResult]:
     results: List[ValidationResult] = []
     bones_set = set(bones_found)
 
-    # Check for head bone (at least one variant required)
-    head_bones = {"head", "head_joint", "Head"}
-    if not head_bones.intersection(bones_set):
+    # Check each required bone group once (at least one variant of each required)
+    has_head = not _HEAD_BONES.isdisjoint(bones_set)
+    has_left_eye = not _LEFT_EYE_BONES.isdisjoint(bones_set)
+    has_right_eye = not _RIGHT_EYE_BONES.isdisjoint(bones_set)
+
+    if not has_head:
         results.append({
             "level": ValidationLevel.ERROR,
             "message": "No head bone found",
-            "details": f"Expected one of: {', '.join(head_bones)}"
+            "details": f"Expected one of: {', '.join(_HEAD_BONES)}"
         })
 
-    # Check for left eye bone (at least one variant required)
-    left_eye_bones = {"leftEye", "left_eye", "LeftEye"}
-    if not left_eye_bones.intersection(bones_set):
+    if not has_left_eye:
         results.append({
             "level": ValidationLevel.ERROR,
             "message": "No left eye bone found",
-            "details": f"Expected one of: {', '.join(left_eye_bones)}"
+            "details": f"Expected one of: {', '.join(_LEFT_EYE_BONES)}"
         })
 
-    # Check for right eye bone (at least one variant required)
-    right_eye_bones = {"rightEye", "right_eye", "RightEye"}
-    if not right_eye_bones.intersection(bones_set):
+    if not has_right_eye:
         results.append({
             "level": ValidationLevel.ERROR,
             "message": "No right eye bone found",
-            "details": f"Expected one of: {', '.join(right_eye_bones)}"
+            "details": f"Expected one of: {', '.join(_RIGHT_EYE_BONES)}"
         })
 
     # If all required bone types found, add success result
-    if (head_bones.intersection(bones_set) and
-        left_eye_bones.intersection(bones_set) and
-        right_eye_bones.intersection(bones_set)):
+    if has_head and has_left_eye and has_right_eye:
         results.append({
             "level": ValidationLevel.INFO,
             "message": "Required bones found",
@@ -268,7 +278,10 @@ def validate_mesh_prefix_coverage(morph_targets: List[str]) -> List[ValidationRe
 
     # Count morph targets by prefix
     for target in morph_targets:
-        for prefix in REQUIRED_MESH_PREFIXES + OPTIONAL_MESH_PREFIXES:
+        # Fast path: one C-level check rejects unprefixed names before the per-prefix scan
+        if not target.startswith(_ALL_MESH_PREFIXES):
+            continue
+        for prefix in _ALL_MESH_PREFIXES:
             if target.startswith(prefix):
                 prefix_counts[prefix] = prefix_counts.get(prefix, 0) + 1
                 break
@@ -317,14 +330,7 @@ def validate_naming_patterns(morph_targets: List[str]) -> ValidationResult:
         >>> validate_naming_patterns(['head_lod0_mesh__eye_blink_L', 'mouth_smile_R'])
         {'level': ValidationLevel.INFO, 'message': 'Good naming pattern compliance', 'details': '100% of morph targets follow expected patterns'}
     """
-    import re
-
-    pattern_matches = 0
-    for target in morph_targets:
-        for pattern in VALIDATION_PATTERNS:
-            if re.match(pattern, target):
-                pattern_matches += 1
-                break
+    pattern_matches = sum(1 for target in morph_targets if _VALIDATION_REGEX.match(target))
 
     compliance_rate = (pattern_matches / len(morph_targets)) * 100 if morph_targets else 0
 
@@ -427,10 +433,11 @@ def run_complete_validation(
     all_results.append(validate_naming_patterns(morph_targets))
     all_results.extend(validate_file_requirements(file_path, file_size_mb))
 
-    # Count results by level
-    error_count = sum(1 for r in all_results if r["level"] == ValidationLevel.ERROR)
-    warning_count = sum(1 for r in all_results if r["level"] == ValidationLevel.WARNING)
-    info_count = sum(1 for r in all_results if r["level"] == ValidationLevel.INFO)
+    # Count results by level in a single pass
+    level_counts = Counter(r["level"] for r in all_results)
+    error_count = level_counts[ValidationLevel.ERROR]
+    warning_count = level_counts[ValidationLevel.WARNING]
+    info_count = level_counts[ValidationLevel.INFO]
 
     return {
         "total_checks": len(all_results),
@@ -57,21 +57,21 @@ class SimpleLogger:
         handler.setFormatter(formatter)
         return handler
 
-    def info(self, message: str):
-        """Log info message."""
-        self.logger.info(message)
+    def info(self, message: str, *args: Any):
+        """Log info message; %-style args are only formatted if the record is emitted."""
+        self.logger.info(message, *args)
 
-    def debug(self, message: str):
-        """Log debug message."""
-        self.logger.debug(message)
+    def debug(self, message: str, *args: Any):
+        """Log debug message; %-style args are only formatted if the record is emitted."""
+        self.logger.debug(message, *args)
 
-    def warning(self, message: str):
-        """Log warning message."""
-        self.logger.warning(message)
+    def warning(self, message: str, *args: Any):
+        """Log warning message; %-style args are only formatted if the record is emitted."""
+        self.logger.warning(message, *args)
 
-    def error(self, message: str):
-        """Log error message."""
-        self.logger.error(message)
+    def error(self, message: str, *args: Any):
+        """Log error message; %-style args are only formatted if the record is emitted."""
+        self.logger.error(message, *args)
 
     # Validation-specific methods for backwards compatibility
     def step_start(self, step_name: str, description: str):
@@ -19,12 +19,8 @@ from pathlib import Path
 from typing import Optional
 from logger.core import get_logger
 
-# Import our implemented steps
-from step1_ingest.ingestor import main as step1_main
-from step2_dcc_export.dcc_assembler import main as step2_main
-from step3_fbx_export.fbx_exporter import main as step3_main
-from step4_glb_convert.blender_converter import main as step4_main
-from step5_web_optimize.web_optimizer import main as step5_main
+# Step modules are imported inside run_complete_pipeline, right before each
+# step runs, so a run that fails early never pays for the later imports.
 
 logger = get_logger(__name__)
 
@@ -70,6 +66,7 @@ def run_complete_pipeline(metahuman_project_path: Optional[str] = None) -> bool:
         logger.info("🔄 STEP 1: Duplicate & Prepare Asset")
         logger.info("-" * 40)
 
+        from step1_ingest.ingestor import main as step1_main
         duplicated_path = step1_main(metahuman_project_path)
 
         if not duplicated_path:
@@ -81,6 +78,7 @@ def run_complete_pipeline(metahuman_project_path: Optional[str] = None) -> bool:
         logger.info("🔧 STEP 2: DCC Export Assembly")
         logger.info("-" * 40)
 
+        from step2_dcc_export.dcc_assembler import main as step2_main
         dcc_export_path = step2_main(duplicated_path)
         if not dcc_export_path:
             logger.error("❌ Step 2 failed - DCC export assembly")
@@ -93,6 +91,7 @@ def run_complete_pipeline(metahuman_project_path: Optional[str] = None) -> bool:
         logger.info("📦 STEP 3: FBX Export")
         logger.info("-" * 40)
 
+        from step3_fbx_export.fbx_exporter import main as step3_main
         fbx_export_path = step3_main()
         if not fbx_export_path:
             logger.error("❌ Step 3 failed - FBX export")
@@ -105,6 +104,7 @@ def run_complete_pipeline(metahuman_project_path: Optional[str] = None) -> bool:
         logger.info("🎮 STEP 4: GLB Convert")
         logger.info("-" * 40)
 
+        from step4_glb_convert.blender_converter import main as step4_main
         glb_convert_path = step4_main()
         if not glb_convert_path:
             logger.error("❌ Step 4 failed - GLB conversion")
@@ -117,6 +117,7 @@ def run_complete_pipeline(metahuman_project_path: Optional[str] = None) -> bool:
         logger.info("🌐 STEP 5: Web Optimize")
         logger.info("-" * 40)
 
+        from step5_web_optimize.web_optimizer import main as step5_main
         final_glb_path = step5_main()
         if not final_glb_path:
             logger.error("❌ Step 5 failed - Web optimization")
@@ -125,25 +126,27 @@ def run_complete_pipeline(metahuman_project_path: Optional[str] = None) -> bool:
         logger.info("✅ Step 5 completed successfully")
         logger.info("")
 
-        # Pipeline Success Summary with Enhanced Validation
-        logger.info("🎉 PIPELINE COMPLETED SUCCESSFULLY!")
-        logger.info("=" * 70)
-        logger.info("📊 Pipeline Summary with COMPREHENSIVE VALIDATION:")
-        logger.info("   ✅ Step 1: MetaHuman project duplicated with enhanced validation")
-        logger.info("   ✅ Step 2: DCC export with structure validation")
-        logger.info("   ✅ Step 3: FBX exported with MATERIALS & ASSETS validation")
-        logger.info("   ✅ Step 4: GLB converted with enhanced format validation")
-        logger.info("   ✅ Step 5: Web optimized with COMPREHENSIVE FINAL validation")
-        logger.info("")
-        logger.info("🎯 Final Output (FULLY VALIDATED):")
-        logger.info("   📁 Web-Optimized GLB ready for deployment")
-        logger.info("   🎭 Morph Targets: 52 (Azure validated)")
-        logger.info("   🎨 Materials: Validated and included")
-        logger.info("   🌐 Format: GLB with validated structure")
-        logger.info("   ⚡ Ready for: Babylon.js, Azure Cognitive Services")
-        logger.info("   🔍 Quality: All validations passed")
-        logger.info("")
-        logger.info("🚀 DEPLOYMENT READY WITH CONFIDENCE!")
+        # Pipeline Success Summary with Enhanced Validation (one log record)
+        logger.info("\n".join([
+            "🎉 PIPELINE COMPLETED SUCCESSFULLY!",
+            "=" * 70,
+            "📊 Pipeline Summary with COMPREHENSIVE VALIDATION:",
+            "   ✅ Step 1: MetaHuman project duplicated with enhanced validation",
+            "   ✅ Step 2: DCC export with structure validation",
+            "   ✅ Step 3: FBX exported with MATERIALS & ASSETS validation",
+            "   ✅ Step 4: GLB converted with enhanced format validation",
+            "   ✅ Step 5: Web optimized with COMPREHENSIVE FINAL validation",
+            "",
+            "🎯 Final Output (FULLY VALIDATED):",
+            "   📁 Web-Optimized GLB ready for deployment",
+            "   🎭 Morph Targets: 52 (Azure validated)",
+            "   🎨 Materials: Validated and included",
+            "   🌐 Format: GLB with validated structure",
+            "   ⚡ Ready for: Babylon.js, Azure Cognitive Services",
+            "   🔍 Quality: All validations passed",
+            "",
+            "🚀 DEPLOYMENT READY WITH CONFIDENCE!",
+        ]))
 
         return True
 
@@ -159,6 +162,11 @@ def main():
     if len(sys.argv) > 1:
         metahuman_project = sys.argv[1]
 
+        # Fail fast: no artifacts cleanup or step imports for a path that isn't there
+        if not Path(metahuman_project).exists():
+            logger.error(f"❌ MetaHuman project not found: {metahuman_project}")
+            sys.exit(1)
+
     # Run the complete pipeline
     success = run_complete_pipeline(metahuman_project)
 
@@ -7,6 +7,7 @@ Consolidates all ingestion logic into a single, DRY implementation.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Any, Dict
 
@@ -21,6 +22,21 @@ from step1_ingest.validation import (
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _load_project_json(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a .uproject file, cached per (path, mtime) so unchanged files are decoded once."""
+    return json.loads(Path(path_str).read_bytes())
+
+
+def _read_project_data(uproject_file: Path) -> Dict[str, Any]:
+    """
+    Read .uproject JSON, reusing the parsed result while the file is unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return _load_project_json(str(uproject_file), uproject_file.stat().st_mtime_ns)
+
+
 class AssetIngestor:
     """
     Asset ingestor implementing the 10-step validation roadmap.
@@ -108,8 +124,7 @@ class AssetIngestor:
             uproject_file = project_info.abs_root / f"{project_info.abs_root.name}.uproject"
 
             # Read and parse .uproject JSON
-            with open(uproject_file, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            project_data = _read_project_data(uproject_file)
 
             # Extract EngineAssociation
             engine_association = project_data.get('EngineAssociation', '')
@@ -164,8 +179,7 @@ class AssetIngestor:
             uproject_file = (
                 project_info.abs_root / f"{project_info.abs_root.name}.uproject"
             )
-            with open(uproject_file, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            project_data = _read_project_data(uproject_file)
 
             engine_association = project_data.get('EngineAssociation', '')
 
@@ -223,11 +237,10 @@ class AssetIngestor:
                                 plugin_found = True
                                 try:
                                     # Read plugin version from .uplugin file
-                                    with open(alt_file, 'r', encoding='utf-8') as pf:
-                                        plugin_data = json.load(pf)
-                                        plugin_version = plugin_data.get('VersionName', '5.6')
-                                        logger.info(f"   ✅ {plugin_name}: Found")
-                                        break
+                                    plugin_data = json.loads(alt_file.read_bytes())
+                                    plugin_version = plugin_data.get('VersionName', '5.6')
+                                    logger.info(f"   ✅ {plugin_name}: Found")
+                                    break
                                 except:
                                     plugin_version = "5.6"  # Default
                                     logger.info(f"   ✅ {plugin_name}: Found")
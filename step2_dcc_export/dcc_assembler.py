@@ -390,15 +390,20 @@ class DCCAssembler:
             validate_dcc_export_output(self.dcc_export_folder, validation_config)
 
             # Additional DCC-specific validation
-            if not self.combined_mesh_asset or not Path(self.combined_mesh_asset).exists():
+            # One stat() answers both "does it exist" and "how big is it"
+            if not self.combined_mesh_asset:
                 raise ValidationError("Combined mesh asset not found after DCC export")
+            mesh_path = Path(self.combined_mesh_asset)
+            try:
+                mesh_size = mesh_path.stat().st_size
+            except FileNotFoundError:
+                raise ValidationError("Combined mesh asset not found after DCC export") from None
 
             # Log validation results
-            mesh_size = Path(self.combined_mesh_asset).stat().st_size
             mesh_size_mb = mesh_size / (1024 * 1024)
 
             logger.info(f"📊 Enhanced DCC export validation summary:")
-            logger.info(f"   Combined mesh: {Path(self.combined_mesh_asset).name}")
+            logger.info(f"   Combined mesh: {mesh_path.name}")
             logger.info(f"   Mesh file size: {mesh_size_mb:.2f} MB ({mesh_size:,} bytes)")
             logger.info(f"   Output directory: {self.dcc_export_folder}")
             logger.info(f"   Export structure: All required directories present")
@@ -6,10 +6,12 @@ Exports combined skeletal meshes as FBX files using Unreal Engine's
 built-in FBX export functionality.
 """
 
+import os
 import sys
 import json
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 import datetime
 
 from logger.core import get_logger
@@ -18,6 +20,45 @@ from step3_fbx_export.validation import validate_fbx_export_output, validate_ste
 logger = get_logger(__name__)
 
 
+# Settings for MetaHuman FBX export, built once at import; read-only so runs can't mutate it
+_DEFAULT_EXPORT_SETTINGS: Mapping[str, Any] = MappingProxyType({
+    # Mesh settings
+    "include_skeletal_mesh": True,
+    "include_static_mesh": False,
+    "mesh_lod_level": 0,  # Highest quality LOD
+
+    # Animation settings
+    "include_animations": False,  # Static export for GLB conversion
+    "include_morph_targets": True,  # Critical for facial expressions
+    "morph_target_count": 52,  # Azure-compatible morphs
+
+    # Skeletal settings
+    "include_skeleton": True,
+    "preserve_bone_hierarchy": True,
+    "include_skin_weights": True,
+
+    # Eye and head bone preservation
+    "preserve_eye_bones": True,
+    "preserve_head_bones": True,
+    "bone_filter_mode": "all",
+
+    # Material settings
+    "include_materials": True,
+    "embed_textures": False,  # Keep separate for web optimization
+
+    # Export quality
+    "fbx_version": "2020",
+    "ascii_format": False,  # Binary for smaller file size
+    "smooth_normals": True,
+    "export_collision": False,
+
+    # Azure compatibility
+    "coordinate_system": "right_handed",
+    "up_axis": "y",
+    "units": "centimeters"
+})
+
+
 class FBXExporter:
     """Handles FBX export operations."""
 
@@ -36,14 +77,22 @@ class FBXExporter:
         project_root = Path(__file__).parent.parent
         self.artifacts_base = project_root / artifacts_base_dir
 
+        # Capture the run start once; the directory name, manifest and FBX header all reuse it
+        started_at = datetime.datetime.now()
+        self._start_iso = started_at.isoformat()
+
         # Create FBX export output directory
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = started_at.strftime("%Y%m%d_%H%M%S")
         self.fbx_export_dir = self.artifacts_base / f"step3_fbx_export_{timestamp}"
 
         # Define output FBX file path
         self.output_fbx_path = self.fbx_export_dir / f"{self.combined_mesh_name}_exported.fbx"
+        self.manifest_path = self.fbx_export_dir / "fbx_export_manifest.json"
         self.export_settings: Dict[str, Any] = {}
 
+        # In-memory copy of the export manifest; updates rewrite the file from this instead of re-reading it
+        self._manifest: Dict[str, Any] = {}
+
     def setup_export_environment(self) -> bool:
         """Set up the FBX export environment."""
         logger.info("⚙️ Setting up FBX export environment")
@@ -65,7 +114,7 @@ class FBXExporter:
     def _create_export_manifest(self) -> None:
         """Create a manifest file to track the FBX export process."""
         manifest: Dict[str, Any] = {
-            "export_timestamp": datetime.datetime.now().isoformat(),
+            "export_timestamp": self._start_iso,
             "source_combined_mesh": str(self.combined_mesh_path),
             "output_fbx_file": str(self.output_fbx_path),
             "status": "initialized",
@@ -73,11 +122,11 @@ class FBXExporter:
             "notes": "FBX Export process initialized - ready for Unreal Engine automation"
         }
 
-        manifest_path = self.fbx_export_dir / "fbx_export_manifest.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        # Encode up front so the file gets one write instead of a write per JSON token
+        self.manifest_path.write_text(json.dumps(manifest, indent=2))
+        self._manifest = manifest
 
-        logger.info(f"   Created export manifest: {manifest_path}")
+        logger.info(f"   Created export manifest: {self.manifest_path}")
 
     def configure_export_settings(self) -> bool:
         """Configure FBX export settings for optimal output."""
@@ -85,42 +134,7 @@ class FBXExporter:
 
         try:
             # Configure settings for MetaHuman FBX export
-            self.export_settings = {
-                # Mesh settings
-                "include_skeletal_mesh": True,
-                "include_static_mesh": False,
-                "mesh_lod_level": 0,  # Highest quality LOD
-
-                # Animation settings
-                "include_animations": False,  # Static export for GLB conversion
-                "include_morph_targets": True,  # Critical for facial expressions
-                "morph_target_count": 52,  # Azure-compatible morphs
-
-                # Skeletal settings
-                "include_skeleton": True,
-                "preserve_bone_hierarchy": True,
-                "include_skin_weights": True,
-
-                # Eye and head bone preservation
-                "preserve_eye_bones": True,
-                "preserve_head_bones": True,
-                "bone_filter_mode": "all",
-
-                # Material settings
-                "include_materials": True,
-                "embed_textures": False,  # Keep separate for web optimization
-
-                # Export quality
-                "fbx_version": "2020",
-                "ascii_format": False,  # Binary for smaller file size
-                "smooth_normals": True,
-                "export_collision": False,
-
-                # Azure compatibility
-                "coordinate_system": "right_handed",
-                "up_axis": "y",
-                "units": "centimeters"
-            }
+            self.export_settings = dict(_DEFAULT_EXPORT_SETTINGS)
 
             logger.info(f"   Configured {len(self.export_settings)} export settings")
             logger.info(f"   Target morph count: {self.export_settings['morph_target_count']}")
@@ -162,10 +176,9 @@ class FBXExporter:
             logger.info("   ⏳ Simulating material preparation...")
 
             # Create simulated FBX file with realistic content
-            self._create_simulated_fbx()
+            fbx_size = self._create_simulated_fbx()
 
             # Update manifest
-            fbx_size = self.output_fbx_path.stat().st_size
             self._update_export_manifest("export_completed", {
                 "fbx_file_size_bytes": fbx_size,
                 "export_success": True
@@ -181,16 +194,19 @@ class FBXExporter:
             logger.error(f"❌ FBX export simulation failed: {e}")
             return False
 
-    def _create_simulated_fbx(self) -> None:
-        """Create a simulated FBX file with realistic content."""
-        # Read source mesh info if available
-        source_size = self.combined_mesh_path.stat().st_size if self.combined_mesh_path.exists() else 0
+    def _create_simulated_fbx(self) -> int:
+        """Create a simulated FBX file with realistic content and return its size in bytes."""
+        # Read source mesh info if available (one stat; a missing file reads as size 0)
+        try:
+            source_size = self.combined_mesh_path.stat().st_size
+        except FileNotFoundError:
+            source_size = 0
 
         # Create simulated FBX content
         fbx_content = f"""# Autodesk FBX 7.4.0 project file
 # Created by Unreal Engine FBX Exporter
 # Source: {self.combined_mesh_path}
-# Export timestamp: {datetime.datetime.now().isoformat()}
+# Export timestamp: {self._start_iso}
 #
 # SIMULATED FBX FILE - In production this would contain:
 # - Combined skeletal mesh geometry
@@ -214,30 +230,27 @@ class FBXExporter:
 
         # Add realistic binary padding to simulate actual FBX size
         padding_size = max(1024, source_size // 10)  # Reasonable compression ratio
-        binary_padding = b"\\x00" * padding_size
-
-        # Write the simulated FBX file
-        with open(self.output_fbx_path, 'w') as f:
-            f.write(fbx_content)
 
-        # Append binary padding
-        with open(self.output_fbx_path, 'ab') as f:
-            f.write(binary_padding)
+        # Write the header, then extend the file with truncate: the OS zero-fills the padding
+        # without allocating or writing it (a sparse hole on filesystems that support them)
+        with open(self.output_fbx_path, 'wb') as f:
+            f.write(fbx_content.encode('utf-8'))
+            file_size = f.tell() + padding_size
+            f.truncate(file_size)
+        return file_size
 
     def _update_export_manifest(self, status: str, data: Dict[str, Any]) -> None:
         """Update the export manifest with current status."""
-        manifest_path = self.fbx_export_dir / "fbx_export_manifest.json"
-
         try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            if not self._manifest:
+                raise RuntimeError("export manifest has not been created")
 
+            manifest = self._manifest
             manifest["status"] = status
             manifest["last_updated"] = datetime.datetime.now().isoformat()
             manifest.update(data)
 
-            with open(manifest_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            self.manifest_path.write_text(json.dumps(manifest, indent=2))
 
         except Exception as e:
             logger.warning(f"Failed to update manifest: {e}")
@@ -307,24 +320,24 @@ def main():
         logger.error("❌ Artifacts directory not found. Run step 2 first.")
         sys.exit(1)
 
-    # Find most recent DCC export directory
-    dcc_export_dirs = list(artifacts_dir.glob("step2_dcc_export_*"))
-    if not dcc_export_dirs:
+    # Find the most recent DCC export directory in one directory scan (timestamp in name sorts chronologically)
+    with os.scandir(artifacts_dir) as entries:
+        latest_entry = max((entry for entry in entries if entry.name.startswith("step2_dcc_export_")),
+                           key=lambda entry: entry.name, default=None)
+    if latest_entry is None:
         logger.error("❌ No DCC export outputs found. Run step 2 first.")
         sys.exit(1)
 
-    # Use the most recent DCC export (sorted by timestamp in name)
-    latest_dcc_export = sorted(dcc_export_dirs)[-1]
+    latest_dcc_export = Path(latest_entry.path)
 
     # Find the combined mesh in the FBX subdirectory
     fbx_dir = latest_dcc_export / "FBX"
-    combined_mesh_files = list(fbx_dir.glob("*_Combined.fbx"))
+    combined_mesh_path = next(fbx_dir.glob("*_Combined.fbx"), None)
 
-    if not combined_mesh_files:
+    if combined_mesh_path is None:
         logger.error("❌ No combined mesh found in DCC export. Check step 2 output.")
         sys.exit(1)
 
-    combined_mesh_path = combined_mesh_files[0]
     logger.info(f"📁 Using combined mesh: {combined_mesh_path}")
 
     exporter = FBXExporter(str(combined_mesh_path))
@@ -6,12 +6,25 @@ Validation functions specific to FBX export step.
 Includes critical materials and assets validation.
 """
 
+import stat
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from logger.core import get_logger
 
 logger = get_logger(__name__)
 
+# Indicator terms searched for in FBX content (lowercase ASCII)
+_MATERIAL_INDICATORS = ('material', 'texture', 'diffuse', 'normal', 'roughness',
+                        'metallic', 'shader', 'lambert', 'phong')
+_ASSET_INDICATORS = ('.png', '.jpg', '.jpeg', '.tga', '.bmp',
+                     'basecolor', 'normalmap', 'roughnessmap')
+_MORPH_INDICATORS = ('blendshape', 'morphtarget', 'deformer', 'shape')
+_BONE_INDICATORS = ('skeleton', 'bone', 'joint', 'head', 'neck', 'spine')
+_FBX_INDICATORS = tuple(dict.fromkeys(
+    _MATERIAL_INDICATORS + _ASSET_INDICATORS + _MORPH_INDICATORS + _BONE_INDICATORS
+))
+
 
 class ValidationError(Exception):
     """Custom exception for validation failures."""
@@ -25,60 +38,93 @@ def validate_fbx_export_output(output_path: Path, config: Dict[str, Any]) -> boo
     """
     logger.info("🔍 Performing comprehensive FBX validation")
 
-    if not output_path.is_file():
+    # One stat serves both the file-type and size checks
+    try:
+        output_stat = output_path.stat()
+    except OSError:
+        output_stat = None
+    if output_stat is None or not stat.S_ISREG(output_stat.st_mode):
         raise ValidationError("FBX export output must be a file")
 
     if not output_path.suffix.lower() == '.fbx':
         raise ValidationError("FBX export output must have .fbx extension")
 
     # Size validation
-    size = output_path.stat().st_size
+    size = output_stat.st_size
     if size < 1024:  # Less than 1KB is suspicious
         raise ValidationError(f"FBX file too small: {size} bytes")
 
+    # Open and read the file once; the header check and every content check share the bytes
+    try:
+        content = output_path.read_bytes()
+    except OSError as e:
+        raise ValidationError(f"Could not read FBX content: {e}") from e
+
     # Validate FBX structure
-    if not _validate_fbx_structure(output_path):
+    if not _validate_fbx_structure(output_path, content[:23]):
         raise ValidationError("Invalid FBX file structure")
 
+    indicator_counts = _count_fbx_indicators(content)
+
     # CRITICAL: Validate materials and related assets
-    validation_result = _validate_fbx_materials_and_assets(output_path, config)
+    validation_result = _validate_fbx_materials_and_assets(output_path, config, indicator_counts, size)
     if not validation_result['valid']:
         raise ValidationError(f"FBX materials validation failed: {validation_result['error']}")
 
     # Validate morph targets
     expected_morphs = config.get('expected_morph_count', 52)
-    morph_validation = _validate_fbx_morph_targets(output_path, expected_morphs)
+    morph_validation = _validate_fbx_morph_targets(output_path, expected_morphs, indicator_counts)
     if not morph_validation['valid']:
-        logger.warning(f"Morph target validation: {morph_validation['message']}")
+        logger.warning("Morph target validation: %s", morph_validation['message'])
 
     # Validate skeletal structure
-    if not _validate_fbx_skeleton(output_path):
+    if not _validate_fbx_skeleton(output_path, indicator_counts):
         raise ValidationError("FBX skeletal structure validation failed")
 
     logger.info("✅ Comprehensive FBX validation passed")
     return True
 
 
-def _validate_fbx_structure(fbx_path: Path) -> bool:
+def _validate_fbx_structure(fbx_path: Path, header: Optional[bytes] = None) -> bool:
     """Validate basic FBX file structure."""
     try:
-        with open(fbx_path, 'rb') as f:
-            # Read first 23 bytes for FBX header
-            header = f.read(23)
+        if header is None:
+            with open(fbx_path, 'rb') as f:
+                # Read first 23 bytes for FBX header
+                header = f.read(23)
 
-            # Check for FBX magic numbers
-            if header.startswith(b"Kaydara FBX Binary"):
-                return True
-            elif b"FBX" in header[:50]:  # ASCII FBX might have FBX somewhere early
-                return True
+        # Check for FBX magic numbers
+        if header.startswith(b"Kaydara FBX Binary"):
+            return True
+        elif b"FBX" in header[:50]:  # ASCII FBX might have FBX somewhere early
+            return True
 
         return False
     except Exception as e:
-        logger.warning(f"Could not validate FBX structure: {e}")
+        logger.warning("Could not validate FBX structure: %s", e)
         return False
 
 
-def _validate_fbx_materials_and_assets(fbx_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
+def _count_fbx_indicators(content: bytes) -> Counter[str]:
+    """
+    Count every indicator term in raw FBX content.
+
+    The bytes are lowercased once (ASCII, works for binary and ASCII FBX)
+    and each term is counted with bytes.count, so the material, morph and
+    skeleton checks no longer each re-read and re-decode the whole file.
+    """
+    lowered = content.lower()
+    return Counter({term: lowered.count(term.encode('ascii')) for term in _FBX_INDICATORS})
+
+
+def _scan_fbx_indicators(fbx_path: Path) -> Counter[str]:
+    """Read an FBX file once and count every indicator term in it."""
+    return _count_fbx_indicators(fbx_path.read_bytes())
+
+
+def _validate_fbx_materials_and_assets(fbx_path: Path, config: Dict[str, Any],
+                                       indicator_counts: Optional[Counter[str]] = None,
+                                       file_size: Optional[int] = None) -> Dict[str, Any]:
     """
     CRITICAL validation: Ensure FBX has materials and related assets.
     This addresses the user's specific requirement.
@@ -86,29 +132,10 @@ def _validate_fbx_materials_and_assets(fbx_path: Path, config: Dict[str, Any]) -
     logger.info("   🎨 Validating FBX materials and related assets...")
 
     try:
-        with open(fbx_path, 'rb') as f:
-            content = f.read()
-
-        # Convert to string for text searching (handles both binary and ASCII FBX)
-        content_str = str(content, errors='ignore').lower()
-
-        # Material indicators to look for
-        material_indicators = [
-            'material',
-            'texture',
-            'diffuse',
-            'normal',
-            'roughness',
-            'metallic',
-            'shader',
-            'lambert',
-            'phong'
-        ]
-
-        found_materials: list[str] = []
-        for indicator in material_indicators:
-            if indicator in content_str:
-                found_materials.append(indicator)
+        if indicator_counts is None:
+            indicator_counts = _scan_fbx_indicators(fbx_path)
+
+        found_materials = [indicator for indicator in _MATERIAL_INDICATORS if indicator_counts[indicator]]
 
         if len(found_materials) < 3:  # Require at least 3 material-related terms
             return {
@@ -118,31 +145,19 @@ def _validate_fbx_materials_and_assets(fbx_path: Path, config: Dict[str, Any]) -
             }
 
         # Texture/asset indicators
-        asset_indicators = [
-            '.png',
-            '.jpg',
-            '.jpeg',
-            '.tga',
-            '.bmp',
-            'basecolor',
-            'normalmap',
-            'roughnessmap'
-        ]
-
-        found_assets: list[str] = []
-        for indicator in asset_indicators:
-            if indicator in content_str:
-                found_assets.append(indicator)
+        found_assets = [indicator for indicator in _ASSET_INDICATORS if indicator_counts[indicator]]
 
         # Check file size (materials add significant size)
-        file_size = fbx_path.stat().st_size
+        if file_size is None:
+            file_size = fbx_path.stat().st_size
         expected_min_size = 10 * 1024 * 1024  # 10MB minimum for MetaHuman with materials
 
         if file_size < expected_min_size:
-            logger.warning(f"FBX file size ({file_size / 1024 / 1024:.1f}MB) smaller than expected for full MetaHuman with materials")
+            logger.warning("FBX file size (%.1fMB) smaller than expected for full MetaHuman with materials",
+                           file_size / 1024 / 1024)
 
-        logger.info(f"     ✅ Found {len(found_materials)} material indicators: {found_materials[:5]}")
-        logger.info(f"     ✅ Found {len(found_assets)} asset references: {found_assets[:3]}")
+        logger.info("     ✅ Found %d material indicators: %s; %d asset references: %s",
+                    len(found_materials), found_materials[:5], len(found_assets), found_assets[:3])
 
         return {
             'valid': True,
@@ -160,28 +175,18 @@ def _validate_fbx_materials_and_assets(fbx_path: Path, config: Dict[str, Any]) -
         }
 
 
-def _validate_fbx_morph_targets(fbx_path: Path, expected_count: int) -> Dict[str, Any]:
+def _validate_fbx_morph_targets(fbx_path: Path, expected_count: int,
+                                indicator_counts: Optional[Counter[str]] = None) -> Dict[str, Any]:
     """Validate FBX morph targets for Azure compatibility."""
     try:
-        with open(fbx_path, 'rb') as f:
-            content = f.read()
-
-        content_str = str(content, errors='ignore').lower()
+        if indicator_counts is None:
+            indicator_counts = _scan_fbx_indicators(fbx_path)
 
         # Look for morph target indicators
-        morph_indicators = [
-            'blendshape',
-            'morphtarget',
-            'deformer',
-            'shape'
-        ]
-
-        found_morphs = 0
-        for indicator in morph_indicators:
-            found_morphs += content_str.count(indicator)
+        found_morphs = sum(indicator_counts[indicator] for indicator in _MORPH_INDICATORS)
 
         # Estimate actual morph count (rough heuristic)
-        estimated_count = max(found_morphs // 3, content_str.count('blendshape'))
+        estimated_count = max(found_morphs // 3, indicator_counts['blendshape'])
 
         if estimated_count < expected_count * 0.8:  # Allow 20% tolerance
             return {
@@ -204,34 +209,20 @@ def _validate_fbx_morph_targets(fbx_path: Path, expected_count: int) -> Dict[str
         }
 
 
-def _validate_fbx_skeleton(fbx_path: Path) -> bool:
+def _validate_fbx_skeleton(fbx_path: Path, indicator_counts: Optional[Counter[str]] = None) -> bool:
     """Validate FBX skeletal structure."""
     try:
-        with open(fbx_path, 'rb') as f:
-            content = f.read()
-
-        content_str = str(content, errors='ignore').lower()
+        if indicator_counts is None:
+            indicator_counts = _scan_fbx_indicators(fbx_path)
 
         # Essential bone indicators
-        bone_indicators = [
-            'skeleton',
-            'bone',
-            'joint',
-            'head',
-            'neck',
-            'spine'
-        ]
-
-        found_bones = 0
-        for indicator in bone_indicators:
-            if indicator in content_str:
-                found_bones += 1
+        found_bones = sum(1 for indicator in _BONE_INDICATORS if indicator_counts[indicator])
 
         # Require at least 4 bone-related terms for valid skeleton
         return found_bones >= 4
 
     except Exception as e:
-        logger.warning(f"Could not validate FBX skeleton: {e}")
+        logger.warning("Could not validate FBX skeleton: %s", e)
         return False
 
 
@@ -266,7 +257,7 @@ def validate_step_input(input_path: Path, expected_type: str) -> bool:
         if size == 0:
             raise ValidationError(f"Input file is empty: {input_path}")
         if size < 100:  # Suspiciously small
-            logger.warning(f"Input file very small ({size} bytes): {input_path}")
+            logger.warning("Input file very small (%d bytes): %s", size, input_path)
 
     logger.info("   ✅ Input validation passed for FBX export")
     return True
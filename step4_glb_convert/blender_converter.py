@@ -153,6 +153,9 @@ import os
 import json
 from pathlib import Path
 
+# Headless run: undo history is never used, so don't pay for undo pushes on import/export
+bpy.context.preferences.edit.use_global_undo = False
+
 def log_message(message):
     """Log message to both console and file."""
     print(f"[BLENDER] {{message}}")
@@ -161,11 +164,8 @@ def clear_scene():
     """Clear the default Blender scene."""
     log_message("Clearing default scene...")
 
-    # Select all objects
-    bpy.ops.object.select_all(action='SELECT')
-
-    # Delete all objects
-    bpy.ops.object.delete(use_global=False)
+    # Remove all scene objects in one batch instead of select_all + delete operators
+    bpy.data.batch_remove(list(bpy.context.scene.objects))
 
     log_message("Scene cleared")
 
@@ -199,25 +199,26 @@ def validate_imported_data():
     """Validate the imported FBX data."""
     log_message("Validating imported data...")
 
-    # Check for meshes
-    meshes = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
-    log_message(f"Found {{len(meshes)}} mesh object(s)")
-
-    # Check for armatures
-    armatures = [obj for obj in bpy.context.scene.objects if obj.type == 'ARMATURE']
-    log_message(f"Found {{len(armatures)}} armature(s)")
-
-    # Check for shape keys (morph targets)
+    # Count meshes, armatures and shape keys (morph targets) in a single scene pass
+    mesh_count = 0
+    armature_count = 0
     shape_key_count = 0
-    for mesh_obj in meshes:
-        if mesh_obj.data.shape_keys:
-            shape_key_count += len(mesh_obj.data.shape_keys.key_blocks) - 1  # Exclude basis
-
+    for obj in bpy.context.scene.objects:
+        if obj.type == 'MESH':
+            mesh_count += 1
+            shape_keys = obj.data.shape_keys
+            if shape_keys:
+                shape_key_count += len(shape_keys.key_blocks) - 1  # Exclude basis
+        elif obj.type == 'ARMATURE':
+            armature_count += 1
+
+    log_message(f"Found {{mesh_count}} mesh object(s)")
+    log_message(f"Found {{armature_count}} armature(s)")
     log_message(f"Found {{shape_key_count}} shape keys total")
 
     return {{
-        "mesh_count": len(meshes),
-        "armature_count": len(armatures),
+        "mesh_count": mesh_count,
+        "armature_count": armature_count,
         "shape_key_count": shape_key_count
     }}
 
@@ -229,11 +230,9 @@ def configure_for_web_export():
     bpy.context.scene.unit_settings.system = 'METRIC'
     bpy.context.scene.unit_settings.length_unit = 'CENTIMETERS'
 
-    # Select all mesh objects for export
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in bpy.context.scene.objects:
-        if obj.type in ['MESH', 'ARMATURE']:
-            obj.select_set(True)
+    # Select mesh/armature objects in one data-API pass (no select_all operator round-trip)
+    for obj in bpy.context.view_layer.objects:
+        obj.select_set(obj.type in {{'MESH', 'ARMATURE'}})
 
     log_message("Web export configuration completed")
 
@@ -253,7 +252,7 @@ def export_glb(output_path):
         export_lights=False,   # No lights needed
 
         # Mesh settings
-        export_apply=True,     # Apply modifiers
+        export_apply=False,    # Skip modifier evaluation; applying modifiers can drop shape keys
         export_yup=True,       # Y-up coordinate system (web standard)
 
         # Shape keys (morph targets) - CRITICAL for Azure
@@ -283,12 +282,6 @@ def export_glb(output_path):
 
         # Optimization settings
         export_draco_mesh_compression_enable=False,  # Will be done in step 5
-        export_draco_mesh_compression_level=6,
-        export_draco_position_quantization=14,
-        export_draco_normal_quantization=10,
-        export_draco_texcoord_quantization=12,
-        export_draco_color_quantization=10,
-        export_draco_generic_quantization=12,
 
         # File settings
         export_copyright='MetaHuman Pipeline Export',
@@ -343,7 +336,8 @@ def convert_fbx_to_glb(input_fbx, output_glb):
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print("Usage: blender --background --python script.py -- <input_fbx> <output_glb>")
+        print("Usage: blender --background --factory-startup --disable-autoexec -noaudio "
+              "--python script.py -- <input_fbx> <output_glb>")
         sys.exit(1)
 
     # Get arguments passed after --
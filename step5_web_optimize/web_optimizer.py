@@ -6,6 +6,7 @@ Optimizes GLB files for web delivery using gltf-transform.
 Applies compression and format conversions while preserving morph targets.
 """
 
+import os
 import sys
 import json
 import subprocess
@@ -18,6 +19,9 @@ from step5_web_optimize.validation import validate_web_optimize_output, validate
 
 logger = get_logger(__name__)
 
+# Byte pattern (0x00..0xFF) tiled into the simulated Draco binary chunk
+_SIMULATED_BINARY_BLOCK = bytes(range(256))
+
 
 class WebOptimizer:
     """Handles GLB optimization for web delivery."""
@@ -233,6 +237,9 @@ class WebOptimizer:
             # Create optimized GLB file
             self._create_optimized_glb()
 
+            # Stat both GLBs once; the result file, manifest and log lines share these numbers
+            perf_metrics = self._calculate_performance_metrics()
+
             # Create optimization result
             optimization_result = {
                 "status": "success",
@@ -249,7 +256,7 @@ class WebOptimizer:
                     "azure_compatibility": True,
                     "babylon_js_ready": True
                 },
-                "performance_metrics": self._calculate_performance_metrics(),
+                "performance_metrics": perf_metrics,
                 "notes": "Simulated optimization - all Azure morph targets preserved"
             }
 
@@ -259,9 +266,8 @@ class WebOptimizer:
                 json.dump(optimization_result, f, indent=2)
 
             # Update manifest
-            optimized_size = self.output_glb_path.stat().st_size
             self._update_optimization_manifest("optimization_completed", {
-                "optimized_file_size_bytes": optimized_size,
+                "optimized_file_size_bytes": perf_metrics["output_size_bytes"],
                 "optimization_success": True,
                 "morph_targets_preserved": 52,
                 "compression_applied": True
@@ -270,8 +276,7 @@ class WebOptimizer:
             logger.info(f"   ✅ Simulated web optimization completed")
             logger.info(f"   📄 Output file: {self.output_glb_path.name}")
 
-                        # Log performance metrics
-            perf_metrics = self._calculate_performance_metrics()
+            # Log performance metrics
             output_kb = perf_metrics["output_size_kb"]
             input_kb = perf_metrics["input_size_kb"]
             compression_pct = perf_metrics["compression_ratio"]
@@ -289,11 +294,10 @@ class WebOptimizer:
 
     def _create_optimized_glb(self) -> None:
         """Create an optimized GLB file by simulating gltf-transform operations."""
-        # Read source GLB
+        # Only the 12-byte GLB header is needed; the size comes from the inode
         with open(self.input_glb_path, 'rb') as f:
-            source_data = f.read()
-
-        source_size = len(source_data)
+            source_size = os.fstat(f.fileno()).st_size
+            source_header = f.read(12)
 
         # Simulate optimization by creating a smaller but valid GLB
         # Typical web optimization can achieve 30-60% compression
@@ -302,9 +306,8 @@ class WebOptimizer:
 
         # Extract GLB header from source
         if source_size >= 12:
-            header = source_data[:12]  # GLB header (magic + version + length)
-            magic = header[:4]
-            version = header[4:8]
+            magic = source_header[:4]  # GLB header (magic + version + length)
+            version = source_header[4:8]
         else:
             # Fallback header
             magic = b'glTF'
@@ -369,8 +372,9 @@ class WebOptimizer:
 
         # Create optimized binary chunk (simulated Draco-compressed data)
         binary_size = max(512, optimized_size - json_length - 20)
-        # Simulate Draco compression pattern
-        binary_content = bytes([i % 256 for i in range(binary_size)])
+        # Simulate Draco compression pattern by repeating the precomputed 0..255 block
+        full_blocks, remainder = divmod(binary_size, len(_SIMULATED_BINARY_BLOCK))
+        binary_content = _SIMULATED_BINARY_BLOCK * full_blocks + _SIMULATED_BINARY_BLOCK[:remainder]
 
         # Calculate total file size
         total_size = 12 + 8 + json_length + 8 + binary_size